@@ -12,6 +12,7 @@ from mathutils import Vector, Matrix, Quaternion
 from math import cos
 from copy import copy
 from weakref import WeakValueDictionary
+from time import monotonic
 import threading
 
 from bpy.props import (
@@ -58,35 +59,133 @@ class BridgeDriver:
     METABALLS_OBJECT_NAME = get_string_buffer("__Metaballs")
 
     MAX_TEXTURE_SLOTS = 64
+
+    # Largest width/height of an image that can be synced with Unity
+    MAX_TEXTURE_SIZE = 1024
+
     UNASSIGNED_TEXTURE_SLOT_NAME = '-- Unassigned --'
 
-    running = False
-    lib = None
-    connection_name: str = None
-    blender_version: str = None
-    has_metaballs: bool = False
+    # How frequently (in seconds) to re-read texture slots from Unity
+    TEXTURE_SLOTS_REFRESH_INTERVAL = 1.0
+
+    # on_tick rates (in seconds) while connected. The timer backs off to
+    # the idle rate after IDLE_TICK_THRESHOLD ticks without a new frame.
+    ACTIVE_TICK_RATE = 0.008 # 120 FPS
+    IDLE_TICK_RATE = 0.032
+    IDLE_TICK_THRESHOLD = 60
+
+    # Minimum time (in seconds) between geometry pushes for a single mesh.
+    # Updates arriving sooner are deferred and flushed from on_tick.
+    GEOMETRY_UPDATE_INTERVAL = 0.016 # 60 FPS
+
+    running: bool
+    connected: bool
+    lib: CDLL
+    connection_name: Array
+    blender_version: Array
+    has_metaballs: bool
+    idle_ticks: int
+    needs_redraw: bool
+    next_texture_sync_time: float
+
+    texture_slots: list
+    texture_slots_version: int
+    texture_slots_refresh_time: float
+    texture_slots_buffer: Array
+
+    image_editor_handle: object # <capsule object RNA_HANDLE>
+    image_buffer: np.ndarray
+    image_buffer_ptr: int
+
+    viewports: WeakValueDictionary
+    objects: set
+    material_objects: dict
+    object_materials: dict
+    geometry_push_times: dict
+    pending_geometry: dict
 
-    image_editor_handle = None # <capsule object RNA_HANDLE>
-    image_buffer = None # np.ndarray
+    def __init__(self):
+        self.running = False
+        self.connected = False
+        self.connection_name = None
+        self.blender_version = None
+        self.has_metaballs = False
+        self.idle_ticks = 0
+        self.next_texture_sync_time = 0
 
-    # Mapping between viewport IDs and RenderEngine instances.
-    # Weakref is used so that we don't hold onto RenderEngine references
-    # since Blender uses __del__ to release them after use
-    viewports = WeakValueDictionary()
+        # Set by events during a tick, so that viewports
+        # are redrawn at most once at the end of on_tick
+        self.needs_redraw = False
 
-    # Tracked object names already synced to the DLL
-    objects = set()
+        # Last texture slot names reported by Unity. The version is bumped
+        # whenever that list changes so that callers can cache derived data.
+        self.texture_slots = []
+        self.texture_slots_version = 0
+        self.texture_slots_refresh_time = 0
+
+        # Reused as the target buffer for each GetTextureSlots call
+        self.texture_slots_buffer = (InteropString64 * self.MAX_TEXTURE_SLOTS)()
+
+        self.image_editor_handle = None
+        self.image_buffer = None
+        self.image_buffer_ptr = None
+
+        # Mapping between viewport IDs and RenderEngine instances.
+        # Weakref is used so that we don't hold onto RenderEngine references
+        # since Blender uses __del__ to release them after use
+        self.viewports = WeakValueDictionary()
+
+        # Tracked object names already synced to the DLL
+        self.objects = set()
+
+        # Reverse index of material uid -> names of tracked objects using it,
+        # and the material uid last sent for each tracked object name.
+        self.material_objects = dict()
+        self.object_materials = dict()
+
+        # Last time geometry was pushed for each mesh uid, and the
+        # name of an object to rebuild each throttled mesh uid from.
+        self.geometry_push_times = dict()
+        self.pending_geometry = dict()
 
-    def __init__(self):
         path = Path(__file__).parent.parent.joinpath(self.DLL_PATH).absolute()
         log('Loading DLL from {}'.format(path))
         self.lib = cdll.LoadLibrary(str(path))
 
-        # Typehint all the API calls we actually need to typehint
+        # Typehint all the API calls we actually use. Prototypes are set once
+        # here so ctypes doesn't have to guess argument conversions on each call.
+        self.lib.Connect.argtypes = (
+            c_void_p,   # connectionName
+            c_void_p,   # versionInfo
+        )
         self.lib.Connect.restype = c_int
+
+        self.lib.Disconnect.argtypes = ()
         self.lib.Disconnect.restype = c_int
+
+        self.lib.Clear.argtypes = ()
         self.lib.Clear.restype = c_int
+
+        self.lib.Update.argtypes = ()
+        self.lib.Update.restype = c_int
+
+        self.lib.IsConnectedToUnity.argtypes = ()
+        self.lib.IsConnectedToUnity.restype = c_bool
+
+        self.lib.IsConnectedToSharedMemory.argtypes = ()
+        self.lib.IsConnectedToSharedMemory.restype = c_bool
+
+        self.lib.AddViewport.argtypes = (c_int, )
+        self.lib.AddViewport.restype = c_int
+
+        self.lib.RemoveViewport.argtypes = (c_int, )
+        self.lib.RemoveViewport.restype = c_int
+
         self.lib.SetViewportCamera.argtypes = (c_int, InteropCamera)
+        self.lib.SetViewportCamera.restype = c_int
+
+        self.lib.ConsumeRenderTextures.argtypes = ()
+        self.lib.ConsumeRenderTextures.restype = c_int
 
 
         #self.lib.GetTextureSlots.argtypes = (
@@ -138,6 +237,19 @@ class BridgeDriver:
         )
         self.lib.SetObjectTransform.restype = c_int
 
+        self.lib.UpdateObjectProperties.argtypes = (
+            c_void_p,           # name
+            c_int,              # ObjectDisplayMode
+            c_void_p,           # mesh
+            c_void_p,           # material
+        )
+        self.lib.UpdateObjectProperties.restype = c_int
+
+        self.lib.RemoveObjectFromScene.argtypes = (
+            c_void_p,           # name
+        )
+        self.lib.RemoveObjectFromScene.restype = c_int
+
         # bpy.types.SpaceView3D.draw_handler_add(post_view_draw, (), 'WINDOW', 'POST_PIXEL')
 
 
@@ -154,8 +266,8 @@ class BridgeDriver:
         log('Starting the DCC')
 
         # TODO: Pull connection name from scene's coherence.connection_name
-        self.connection_name = create_string_buffer("Coherence".encode())
-        self.blender_version = create_string_buffer(bpy.app.version_string.encode())
+        self.connection_name = get_string_buffer("Coherence")
+        self.blender_version = get_string_buffer(bpy.app.version_string)
         self.running = True
 
         # Register active viewports
@@ -166,9 +278,9 @@ class BridgeDriver:
         depsgraph_update_post.append(self.on_depsgraph_update)
         load_pre.append(self.on_load_pre)
 
-        # Register timers for frequent updates
+        # Register a timer for frequent updates. Texture syncing
+        # is scheduled from within the same timer.
         bpy.app.timers.register(self.on_tick)
-        bpy.app.timers.register(self.check_texture_sync)
 
         # Monitor updates in SpaceImageEditor for texture syncing
         self.image_editor_handle = bpy.types.SpaceImageEditor.draw_handler_add(
@@ -195,10 +307,15 @@ class BridgeDriver:
 
         # Clear local tracking
         self.objects = set()
+        self.material_objects = dict()
+        self.object_materials = dict()
+        self.geometry_push_times = dict()
+        self.pending_geometry = dict()
         self.has_metaballs = False
 
         # Turning off `running` will also destroy the `on_tick` timer.
         self.running = False
+        self.connected = False
 
         if self.on_depsgraph_update in depsgraph_update_post:
             depsgraph_update_post.remove(self.on_depsgraph_update)
@@ -227,17 +344,32 @@ class BridgeDriver:
     def get_texture_slots(self) -> list:
         """Return all sync-able texture slot names exposed by Unity
 
+        Slots are re-read from the DLL at most once per
+        TEXTURE_SLOTS_REFRESH_INTERVAL, as this is hit by UI redraws.
+
         Returns:
             list[str]
         """
+        now = monotonic()
+
         if not self.is_connected():
-            return []
+            slots = []
+        elif now < self.texture_slots_refresh_time:
+            return self.texture_slots
+        else:
+            self.texture_slots_refresh_time = now + self.TEXTURE_SLOTS_REFRESH_INTERVAL
+
+            buffer = self.texture_slots_buffer
+            size = self.lib.GetTextureSlots(buffer, len(buffer))
 
-        buffer = (InteropString64 * self.MAX_TEXTURE_SLOTS)()
-        size = self.lib.GetTextureSlots(buffer, len(buffer))
+            # Convert byte arrays to a list of strings.
+            slots = [self.UNASSIGNED_TEXTURE_SLOT_NAME] + [buffer[i].buffer.decode('utf-8') for i in range(size)]
 
-        # Convert byte arrays to a list of strings.
-        return [self.UNASSIGNED_TEXTURE_SLOT_NAME] + [buffer[i].buffer.decode('utf-8') for i in range(size)]
+        if slots != self.texture_slots:
+            self.texture_slots = slots
+            self.texture_slots_version += 1
+
+        return self.texture_slots
 
 
     def sync_texture(self, image):
@@ -250,23 +382,30 @@ class BridgeDriver:
         if settings.error or settings.texture_slot == self.UNASSIGNED_TEXTURE_SLOT_NAME:
             return
 
-        # TODO: Optimize further (e.g. don't allocate
-        # the numpy buffer each time, etc etc)
         w, h = image.size
+        size = w * h * 4
+
+        # Images may have been resized since validation
+        if size > self.MAX_TEXTURE_SIZE * self.MAX_TEXTURE_SIZE * 4:
+            return
 
+        # Reserve enough space for the largest syncable image once
+        # and write each image into a view at the front of it.
+        # Since views share the buffer's address, the pointer is reused.
         if self.image_buffer is None:
-            self.image_buffer = np.empty(w * h * 4, dtype=np.float32)
-        else:
-            self.image_buffer.resize(w * h * 4, refcheck=False)
+            self.image_buffer = np.empty(
+                self.MAX_TEXTURE_SIZE * self.MAX_TEXTURE_SIZE * 4,
+                dtype=np.float32
+            )
+            self.image_buffer_ptr = self.image_buffer.ctypes.data
 
-        image.pixels.foreach_get(self.image_buffer)
-        pixels_ptr = self.image_buffer.ctypes.data
+        image.pixels.foreach_get(self.image_buffer[:size])
 
         self.lib.UpdateTexturePixels(
             get_string_buffer(settings.texture_slot),
-            image.size[0],
-            image.size[1],
-            pixels_ptr
+            w,
+            h,
+            self.image_buffer_ptr
         )
 
     def add_viewport(self, render_engine):
@@ -297,10 +436,13 @@ class BridgeDriver:
     def is_connected(self) -> bool:
         """Is the bridge currently connected to an instance of Unity
 
+        The connection state is read from the DLL once per on_tick,
+        after messages have been processed by lib.Update().
+
         Returns:
             bool
         """
-        return self.running and self.lib.IsConnectedToUnity()
+        return self.running and self.connected
 
     def is_running(self) -> bool:
         """Is the driver actively trying to / is connected to Unity
@@ -322,21 +464,46 @@ class BridgeDriver:
             log('Deactivating on_tick timer')
             return None
 
+        if self.pending_geometry:
+            self.flush_pending_geometry()
+
         # While actively connected to Unity, send typical IO,
         # get viewport renders, and run as fast as possible
-        if self.is_connected():
+        if self.connected:
             self.lib.Update()
-            self.lib.ConsumeRenderTextures()
-
-            self.tag_redraw_viewports()
+            self.connected = self.lib.IsConnectedToUnity()
+
+            # Texture syncs run on their own (slower) schedule
+            now = monotonic()
+            if now >= self.next_texture_sync_time:
+                try:
+                    self.next_texture_sync_time = now + self.check_texture_sync()
+                except Exception as e:
+                    error('Failed to sync texture: {}'.format(e))
+                    # Back off rather than failing again on every tick
+                    self.next_texture_sync_time = now + self.TEXTURE_SLOTS_REFRESH_INTERVAL
+
+            # Only redraw viewports once Unity has sent a new frame.
+            # Without any viewports open there's nothing to read frames
+            # into, so skip consuming them and tick at the idle rate.
+            has_viewports = len(self.viewports) > 0
+            if has_viewports and self.lib.ConsumeRenderTextures() > 0:
+                self.idle_ticks = 0
+                self.needs_redraw = True
+            else:
+                self.idle_ticks += 1
 
             # If we lost connection while polling - flag a disconnect
-            if not self.is_connected():
+            if not self.connected:
                 self.on_disconnected_from_unity()
 
-            #return 0.0001
-            #return 0.016 # 60 FPS update rate
-            return 0.008 # 120 FPS
+            if self.needs_redraw:
+                self.tag_redraw_viewports()
+
+            if not has_viewports or self.idle_ticks > self.IDLE_TICK_THRESHOLD:
+                return self.IDLE_TICK_RATE
+
+            return self.ACTIVE_TICK_RATE
 
         # Attempt to connect to shared memory if not already
         if not self.lib.IsConnectedToSharedMemory():
@@ -350,39 +517,46 @@ class BridgeDriver:
 
         # Poll for updates from Unity until we get one.
         self.lib.Update()
+        self.connected = self.lib.IsConnectedToUnity()
 
-        if self.is_connected():
+        if self.connected:
             self.on_connected_to_unity()
 
+        if self.needs_redraw:
+            self.tag_redraw_viewports()
+
         return 0.05
 
     def check_texture_sync(self) -> float:
         """Push image updates to Unity if we're actively drawing
             on an image bound to one of the synced texture slots
 
+        Called from on_tick whenever the previous delay has elapsed.
+
         Returns:
-            float: Milliseconds until the next check
+            float: Seconds until the next check
         """
-        delay = bpy.context.scene.coherence.texture_slot_update_frequency
+        context = bpy.context
+        delay = context.scene.coherence.texture_slot_update_frequency
 
-        # Don't do anything if we're still not connected
-        if bpy.context.mode != 'PAINT_TEXTURE' or not self.is_connected():
+        # Don't do anything if we're not painting or still not connected
+        if context.mode != 'PAINT_TEXTURE' or not self.is_connected():
             return delay
 
-        image = bpy.context.tool_settings.image_paint.canvas
-
-        # Tool is active but we don't have an image assigned
-        if image is None:
-            return delay
+        image = context.tool_settings.image_paint.canvas
 
-        self.sync_texture(image)
+        # Skip if the tool is active but we don't have an image assigned, or nothing
+        # has been painted onto the image since it was loaded or saved
+        if image is not None and image.is_dirty:
+            self.sync_texture(image)
 
         return delay
 
     def on_connected_to_unity(self):
         debug('on_connected_to_unity')
-        self.tag_redraw_viewports()
-        pass
+        self.texture_slots_refresh_time = 0
+        self.idle_ticks = 0
+        self.needs_redraw = True
 
     def on_connected_to_shared_memory(self):
         debug('on_connected_to_shared_memory')
@@ -390,16 +564,24 @@ class BridgeDriver:
 
     def on_disconnected_from_unity(self):
         debug('on_disconnected_from_unity')
-        self.tag_redraw_viewports()
-        pass
+        self.needs_redraw = True
 
     def tag_redraw_viewports(self):
         """Tag all active render engines for a redraw"""
-        for v in self.viewports.items():
+        self.needs_redraw = False
+
+        # Iterate over a snapshot of weak references so that dead engines
+        # are skipped rather than kept alive, and so that an engine being
+        # released mid-loop can't mutate the dictionary under us.
+        for ref in list(self.viewports.valuerefs()):
+            render_engine = ref()
+            if render_engine is None:
+                continue
+
             try:
-                v[1].on_update()
-            except e:
-                error(sys.exc_info()[0])
+                render_engine.on_update()
+            except Exception as e:
+                error('Failed to update viewport {}: {}'.format(ref.key, e))
 
     def sync_tracked_objects(self, scene, depsgraph):
         """Add/remove objects from the bridge to match the scene.
@@ -410,27 +592,27 @@ class BridgeDriver:
             scene (bpy.types.Scene)
             depsgraph (bpy.types.Depsgraph)
         """
+        objects = scene.objects
         current = set() # Set of tracked object names
-        found_metaballs = False
+        metaballs = None
 
-        # Check for added objects
-        for obj in scene.objects:
+        for obj in objects:
             if is_supported_object(obj):
-                if obj.name not in self.objects:
-                    self.on_add_object(obj, depsgraph)
-
                 current.add(obj.name)
-            elif obj.type == 'META':
-                found_metaballs = True
-                if not self.has_metaballs:
-                    self.on_add_metaballs(obj, depsgraph)
+            elif metaballs is None and obj.type == 'META':
+                metaballs = obj
+
+        # Check for added objects. Only these need to be looked up again.
+        for name in current - self.objects:
+            self.on_add_object(objects[name], depsgraph)
 
         # Check for removed objects
-        removed = self.objects - current
-        for name in removed:
+        for name in self.objects - current:
             self.on_remove_object(name)
 
-        if not found_metaballs and self.has_metaballs:
+        if metaballs is not None and not self.has_metaballs:
+            self.on_add_metaballs(metaballs, depsgraph)
+        elif metaballs is None and self.has_metaballs:
             self.on_remove_metaballs()
 
         # Update current tracked list
@@ -441,8 +623,10 @@ class BridgeDriver:
 
         # Only try to sync updates if we're actively painting
         # on an image. Any other action (masking, viewing) are ignored.
-        if space.mode == 'PAINT' and space.image:
-            self.sync_texture(space.image)
+        if space.mode == 'PAINT':
+            image = space.image
+            if image:
+                self.sync_texture(image)
 
     def on_load_pre(self, *args, **kwargs):
         """Stop Coherence when our Blender file changes.
@@ -463,23 +647,45 @@ class BridgeDriver:
 
         # Only update metaballs as a whole once per tick
         has_metaball_updates = False
+
+        # Updates are coalesced so that each object (or unique mesh)
+        # is sent to the bridge at most once per kind of change, even if
+        # it's reported multiple times (e.g. via the object and its material)
+        transform_updates = {}
+        property_updates = {}
         geometry_updates = {}
 
-        self.sync_tracked_objects(scene, depsgraph)
+        # Objects can only be added/removed/renamed alongside an update
+        # to an object or the collections/scene that contain them.
+        if (depsgraph.id_type_updated('OBJECT')
+                or depsgraph.id_type_updated('COLLECTION')
+                or depsgraph.id_type_updated('SCENE')):
+            self.sync_tracked_objects(scene, depsgraph)
 
         # Check for updates to objects (geometry changes, transform changes, etc)
+        # Lookups used per update are bound locally, as each access
+        # to update.id creates a new RNA wrapper for the ID
+        tracked = self.objects
+        get_object = bpy.data.objects.get
+
         for update in depsgraph.updates:
-            if type(update.id) == bpy.types.Material:
-                self.on_update_material(update.id)
-            elif type(update.id) == bpy.types.Object:
+            datablock = update.id
+            id_type = type(datablock)
+
+            if id_type == bpy.types.Material:
+                for obj in self.get_material_users(datablock):
+                    property_updates[obj.name] = obj
+            elif id_type == bpy.types.Object:
+                name = datablock.name
+
                 # Get the real object, not the copy in the update
-                obj = bpy.data.objects.get(update.id.name)
+                obj = get_object(name)
                 if obj.type == 'META':
                     has_metaball_updates = True
-                elif update.id.name in self.objects:
+                elif name in tracked:
                     # If it's a tracked object - update transform/geo/etc where appropriate
                     if update.is_updated_transform:
-                        self.on_update_transform(obj)
+                        transform_updates[name] = obj
 
                     if update.is_updated_geometry:
                         # Aggregate *unique* meshes that need to be updated this
@@ -488,17 +694,81 @@ class BridgeDriver:
                         geometry_updates[get_mesh_uid(obj)] = obj
 
                     # Push any other updates we may be tracking for this object
-                    self.on_update_properties(obj)
+                    property_updates[name] = obj
+
+        for obj in transform_updates.values():
+            self.on_update_transform(obj)
+
+        for obj in property_updates.values():
+            self.on_update_properties(obj)
+
+        # Handle all geometry updates. Meshes pushed too recently are deferred
+        # to on_tick so that modal operators (sculpting, grabbing, etc) that
+        # update on every mouse event don't resend the mesh each time.
+        now = monotonic()
+        push_times = self.geometry_push_times
 
-        # Handle all geometry updates
         for uid, obj in geometry_updates.items():
-            debug('GEO UPDATE uid={}, obj={}'.format(uid, obj.name))
-            self.on_update_geometry(obj, depsgraph)
+            if now - push_times.get(uid, 0) < self.GEOMETRY_UPDATE_INTERVAL:
+                self.pending_geometry[uid] = obj.name
+                continue
+
+            debug('GEO UPDATE uid={}, obj={}', uid, obj.name)
+            self.pending_geometry.pop(uid, None)
+            push_times[uid] = now
+            self.on_update_geometry(obj, depsgraph, uid)
 
         # A change to any metaball will trigger a re-evaluation of them all as one object
         if has_metaball_updates:
             self.on_update_metaballs(scene, depsgraph)
 
+    def flush_pending_geometry(self):
+        """Push geometry updates deferred by on_depsgraph_update
+            for meshes that are no longer being throttled"""
+        now = monotonic()
+        interval = self.GEOMETRY_UPDATE_INTERVAL
+        push_times = self.geometry_push_times
+        pending = self.pending_geometry
+
+        due = [uid for uid in pending if now - push_times.get(uid, 0) >= interval]
+        if not due:
+            return
+
+        # Evaluating the depsgraph can re-enter on_depsgraph_update, which
+        # may push or re-defer pending meshes. So pending entries are only
+        # popped after this point, and the name popped is the latest one.
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+        for uid in due:
+            name = pending.pop(uid, None)
+            if name is None:
+                continue
+
+            # The object may have been removed or renamed since it was deferred
+            obj = bpy.data.objects.get(name)
+            if obj is None or name not in self.objects:
+                push_times.pop(uid, None)
+                continue
+
+            # Marked as pushed before evaluating the mesh so that any
+            # re-entrant update for it is deferred rather than sent twice
+            push_times[uid] = now
+
+            debug('GEO UPDATE (deferred) uid={}, obj={}', uid, name)
+
+            # Mesh uid isn't passed through, as modifiers may have
+            # changed since this update was deferred
+            self.on_update_geometry(obj, depsgraph)
+
+        # Once nothing is throttled, drop push times that have expired.
+        # They no longer defer anything, and uids of deleted or renamed
+        # meshes would otherwise accumulate for the whole session.
+        if not pending:
+            self.geometry_push_times = {
+                uid: t for uid, t in push_times.items()
+                if now - t < interval
+            }
+
     def on_add_object(self, obj, depsgraph):
         """Notify the bridge that the object has been added to the scene
 
@@ -508,7 +778,7 @@ class BridgeDriver:
         """
         mat_name = get_material_uid(obj.active_material)
 
-        debug('on_add_object - name={}, mat_name={}'.format(obj.name, mat_name))
+        debug('on_add_object - name={}, mat_name={}', obj.name, mat_name)
 
         # TODO: Other object types
 
@@ -540,7 +810,9 @@ class BridgeDriver:
         Args:
             name (str): Unique object name shared with the Bridge
         """
-        debug('on_remove_object - name={}'.format(name))
+        debug('on_remove_object - name={}', name)
+
+        self.update_material_index(name, None)
 
         self.lib.RemoveObjectFromScene(
             get_string_buffer(name)
@@ -583,7 +855,7 @@ class BridgeDriver:
         Args:
             obj (bpy.types.Object): The object that was updated
         """
-        debug('on_update_transform - name={}'.format(obj.name))
+        debug('on_update_transform - name={}', obj.name)
 
         transform = to_interop_transform(obj)
         self.lib.SetObjectTransform(
@@ -600,11 +872,13 @@ class BridgeDriver:
         mesh_uid = get_mesh_uid(obj)
         mat_uid = get_material_uid(obj.active_material)
 
-        debug('on_update_properties - name={}, mesh={}, mat={}'.format(
+        debug('on_update_properties - name={}, mesh={}, mat={}',
             obj.name,
             mesh_uid,
             mat_uid
-        ))
+        )
+
+        self.update_material_index(obj.name, mat_uid)
 
         self.lib.UpdateObjectProperties(
             get_string_buffer(obj.name),
@@ -613,7 +887,7 @@ class BridgeDriver:
             get_string_buffer(mat_uid)
         )
 
-    def on_update_geometry(self, obj, depsgraph):
+    def on_update_geometry(self, obj, depsgraph, mesh_uid=None):
         """Notify Unity that mesh geometry may have changed
 
         An object is provided instead of the bpy.types.Mesh
@@ -623,15 +897,29 @@ class BridgeDriver:
         Args:
             obj (bpy.types.Object):             The object that received the update
             depsgraph (bpy.types.Depsgraph):    Dependency graph to use for generating a final mesh
+            mesh_uid (str|None):                Mesh uid of the object, if already known
         """
-        mesh_uid = get_mesh_uid(obj)
-
-        debug('on_update_geometry - name={}, mesh={}'.format(obj.name, mesh_uid))
-
-        # We need to do both evaluated_get() and preserve_all_data_layers=True to ensure
-        # that - if the mesh is instanced - modifiers are applied to the correct instances.
-        eval_obj = obj.evaluated_get(depsgraph)
-        mesh = eval_obj.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+        if mesh_uid is None:
+            mesh_uid = get_mesh_uid(obj)
+
+        debug('on_update_geometry - name={}, mesh={}', obj.name, mesh_uid)
+
+        # A mesh that isn't modified evaluates to its own data,
+        # so we can skip building a temporary evaluated copy. is_modified()
+        # covers real modifiers, virtual ones from deforming parents
+        # (armature, lattice) and shape keys. Meshes in edit mode (through this
+        # or any linked duplicate) are excluded as edits aren't written back
+        # to obj.data until exit.
+        eval_obj = None
+        if (obj.type == 'MESH'
+                and not obj.data.is_editmode
+                and not obj.is_modified(depsgraph.scene, 'PREVIEW')):
+            mesh = obj.data
+        else:
+            # We need to do both evaluated_get() and preserve_all_data_layers=True to ensure
+            # that - if the mesh is instanced - modifiers are applied to the correct instances.
+            eval_obj = obj.evaluated_get(depsgraph)
+            mesh = eval_obj.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
 
         # TODO: preserve_all_data_layers is only necessary if instanced and modifier
         # stacks change per instance. Might be cheaper to turn this off if a mesh is used only once.
@@ -665,7 +953,8 @@ class BridgeDriver:
             uv_ptr[3]
         )
 
-        eval_obj.to_mesh_clear()
+        if eval_obj is not None:
+            eval_obj.to_mesh_clear()
 
     def on_update_metaballs(self, scene, depsgraph):
         """Rebuild geometry from metaballs in the scene and send to Unity
@@ -680,7 +969,7 @@ class BridgeDriver:
             if obj.type == 'META':
                 break
 
-        debug('on_update_metaballs obj={}'.format(obj))
+        debug('on_update_metaballs obj={}', obj)
 
         # Get the evaluated post-modifiers mesh
         eval_obj = obj.evaluated_get(depsgraph)
@@ -698,7 +987,6 @@ class BridgeDriver:
         )
 
         self.lib.CopyMeshDataNative(
-            self.METABALLS_OBJECT_NAME,
             self.METABALLS_OBJECT_NAME,
             mesh.loops[0].as_pointer(),
             len(mesh.loops),
@@ -717,17 +1005,53 @@ class BridgeDriver:
 
         eval_obj.to_mesh_clear()
 
-    def on_update_material(self, mat):
-        """
+    def get_material_users(self, mat) -> list:
+        """Find tracked objects in the scene using the given material
+
         Args:
             mat (bpy.types.Material)
+
+        Returns:
+            list[bpy.types.Object]
+        """
+        # Depsgraph updates hand us the evaluated copy, which never
+        # compares equal to the original assigned to objects.
+        mat = mat.original
+        names = self.material_objects.get(mat.name)
+
+        # A material we haven't indexed may have just been renamed,
+        # so fall back to finding its users by scanning the scene.
+        if names is None:
+            return [
+                obj for obj in bpy.context.scene.objects
+                if obj.active_material == mat and obj.name in self.objects
+            ]
+
+        objects = bpy.context.scene.objects
+        return [obj for obj in map(objects.get, names) if obj is not None]
+
+    def update_material_index(self, name, mat_uid):
+        """Track which material an object was last synced with
+
+        Args:
+            name (str):             Tracked object name
+            mat_uid (str|None):     Material uid, or None to stop tracking the object
         """
-        debug('on_update_material - name={}'.format(mat.name))
+        prev_uid = self.object_materials.get(name)
+        if prev_uid == mat_uid:
+            return
+
+        if prev_uid is not None:
+            users = self.material_objects[prev_uid]
+            users.discard(name)
+            if not users:
+                del self.material_objects[prev_uid]
 
-        # Fire off an update for all objects that are using it
-        for obj in bpy.context.scene.objects:
-            if obj.active_material == mat and obj.name in self.objects:
-                self.on_update_properties(obj)
+        if mat_uid is None:
+            self.object_materials.pop(name, None)
+        else:
+            self.object_materials[name] = mat_uid
+            self.material_objects.setdefault(mat_uid, set()).add(name)
 
 __singleton = BridgeDriver()
 
@@ -148,10 +148,6 @@ class CoherenceRenderEngine(bpy.types.RenderEngine):
         """
         self.connected = bridge_driver().is_connected()
 
-        if self.connected:
-            lib = bridge_driver().lib
-            lib.SetViewportCamera(self.viewport_id, self.camera)
-
         # # Poll for a new render texture image and upload
         # # to the GPU once we acquire a lock on the texture buffer
         # rt = lib.GetRenderTexture(self.viewport_id)
@@ -212,7 +208,7 @@ class CoherenceRenderEngine(bpy.types.RenderEngine):
         glBindTexture(GL_TEXTURE_2D, self.bindcode)
 
         if create_new:
-            debug('glTexImage2D using {} x {} at {}'.format(width, height, pixels))
+            debug('glTexImage2D using {} x {} at {}', width, height, pixels)
 
             # TODO: Would be nice if I didn't have to match pixel resolution here.
             # Use an alternate shader that doesn't need this?
@@ -246,7 +242,7 @@ class CoherenceRenderEngine(bpy.types.RenderEngine):
         Args:
             visible_ids (List[int])
         """
-        debug('BRIDGE: Update Visible ID List {}'.format(visible_ids))
+        debug('BRIDGE: Update Visible ID List {}', visible_ids)
 
         # TODO: Reimplement using object names
 
@@ -355,6 +351,11 @@ class CoherenceRenderEngine(bpy.types.RenderEngine):
 
         if self.connected:
             self.update_viewport_camera(context)
+
+            # Camera changes are sent as soon as they're known, rather than
+            # waiting for the driver to tag this viewport on a new frame
+            bridge_driver().lib.SetViewportCamera(self.viewport_id, self.camera)
+
             self.update_render_texture()
 
             if self.bindcode != -1:
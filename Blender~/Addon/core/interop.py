@@ -120,11 +120,9 @@ def to_interop_transform(obj):
     Returns:
         InteropTransform
     """
-    mat = Matrix(obj.matrix_world)
+    mat = obj.matrix_world
 
     pos = mat.to_translation()
-    eul = mat.to_euler('ZXY')
-
     rot = mat.to_quaternion()
 
     # Scale pulled from the object not the matrix since
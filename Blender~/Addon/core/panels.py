@@ -67,7 +67,6 @@ class COHERENCE_IMAGEPAINT_PT_texture_sync(Panel):
     def draw(self, context):
         layout = self.layout
 
-        print(context)
         image = context.space_data.image
 
         if not image:
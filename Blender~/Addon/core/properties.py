@@ -3,8 +3,6 @@ from bpy.props import (
     BoolProperty,
     EnumProperty,
     FloatProperty,
-    FloatVectorProperty,
-    IntProperty,
     PointerProperty,
     StringProperty
 )
@@ -18,9 +16,15 @@ from bpy.types import (
 from util.registry import autoregister
 
 from .driver import (
+    BridgeDriver,
     bridge_driver
 )
 
+from .utils import (
+    debug,
+    get_material_uid
+)
+
 def change_sync_texture(self, context):
     """
     Args:
@@ -29,7 +33,7 @@ def change_sync_texture(self, context):
     """
     img = self.sync_texture # bpy.types.Image
 
-    print('CHANGE Texture2D Sync image={}'.format(img))
+    debug('CHANGE Texture2D Sync image={}', img)
 
 def update_sync_texture_settings(self, context):
     mat = context.material
@@ -38,9 +42,9 @@ def update_sync_texture_settings(self, context):
     name = mat.name
 
     if self.use_sync_texture:
-        print('UPDATE Texture2D sync for uid={}, name={}'.format(uid, name))
+        debug('UPDATE Texture2D sync for uid={}, name={}', uid, name)
     else:
-        print('DISABLE/SKIP Texture2D sync for uid={}, name={}'.format(uid, name))
+        debug('DISABLE/SKIP Texture2D sync for uid={}, name={}', uid, name)
 
 def update_object_properties(self, context):
     """
@@ -48,7 +52,15 @@ def update_object_properties(self, context):
         self (CoherenceObjectSettings)
         context (bpy.types.Context)
     """
-    bridge_driver().on_update_properties(context.object)
+    obj = context.object
+    driver = bridge_driver()
+
+    # Objects are only known to the bridge while it's running. State for
+    # anything else gets sent in full once it's added to the scene.
+    if obj is None or not driver.is_running() or obj.name not in driver.objects:
+        return
+
+    driver.on_update_properties(obj)
 
 @autoregister
 class CoherenceRendererSettings(PropertyGroup):
@@ -84,25 +96,27 @@ class CoherenceRendererSettings(PropertyGroup):
     def unregister(cls):
         del bpy.types.Scene.coherence
 
+# Enum items match ObjectDisplayMode in C#
+# First value will be cast to an int when passed to the bridge
+DISPLAY_MODE_ITEMS = (
+    ('0', 'Material', '', 0),
+    ('1', 'Normals', 'Show vertex normals in Unity', 1),
+    ('2', 'Vertex Colors', 'Show vertex colors in Unity', 2),
+
+    ('10', 'UV Checker', 'Show UV values in Unity', 10),
+    ('11', 'UV2 Checker', 'Show UV2 values in Unity', 11),
+    ('12', 'UV3 Checker', 'Show UV3 values in Unity', 12),
+    ('13', 'UV4 Checker', 'Show UV4 values in Unity', 13),
+
+    ('100', 'Hidden', 'Do not render this object in Unity', 100),
+)
+
 @autoregister
 class CoherenceObjectProperties(PropertyGroup):
     display_mode: EnumProperty(
         name='Unity Display Mode',
         description='Technique used to render this object within Unity',
-        items=[
-            # Enum items match ObjectDisplayMode in C#
-            # First value will be cast to an int when passed to the bridge
-            ('0', 'Material', '', 0),
-            ('1', 'Normals', 'Show vertex normals in Unity', 1),
-            ('2', 'Vertex Colors', 'Show vertex colors in Unity', 2),
-
-            ('10', 'UV Checker', 'Show UV values in Unity', 10),
-            ('11', 'UV2 Checker', 'Show UV2 values in Unity', 11),
-            ('12', 'UV3 Checker', 'Show UV3 values in Unity', 12),
-            ('13', 'UV4 Checker', 'Show UV4 values in Unity', 13),
-
-            ('100', 'Hidden', 'Do not render this object in Unity', 100),
-        ],
+        items=DISPLAY_MODE_ITEMS,
         update=update_object_properties
     )
 
@@ -144,14 +158,38 @@ def validate_image_for_sync(img) -> str:
     #if img.depth != 32:
     #    return 'Image must contain an alpha channel'
 
-    if w < 1 or h < 1 or w > 1024 or h > 1024:
-        return 'Image must be between 1x1 and 1024x1024 to enable syncing'
+    max_size = BridgeDriver.MAX_TEXTURE_SIZE
+    if not (1 <= w <= max_size and 1 <= h <= max_size):
+        return 'Image must be between 1x1 and {0}x{0} to enable syncing'.format(max_size)
 
     return ''
 
+# Blender requires Python to hold a reference to dynamic EnumProperty items
+# for as long as they're in use, so the last generated list is kept here
+# and only rebuilt when the driver reports a change in texture slots.
+__texture_slot_enum_cache = {
+    'version': -1,
+    'items': []
+}
+
+# Stable fallback for when Unity isn't around to provide slots
+UNCONNECTED_TEXTURE_SLOT_ITEMS = [
+    ('-', '-- Not Connected --', '')
+]
+
 def texture_slot_enum_items(self, context):
-    slots = bridge_driver().get_texture_slots()
-    return [(name, name, '') for name in slots]
+    driver = bridge_driver()
+    if not driver.is_connected():
+        return UNCONNECTED_TEXTURE_SLOT_ITEMS
+
+    slots = driver.get_texture_slots()
+
+    cache = __texture_slot_enum_cache
+    if cache['version'] != driver.texture_slots_version:
+        cache['items'] = [(name, name, '') for name in slots]
+        cache['version'] = driver.texture_slots_version
+
+    return cache['items']
 
 def on_update_texture_slot(self, context):
     image = self.id_data
@@ -161,7 +199,9 @@ def on_update_texture_slot(self, context):
     self.error = validate_image_for_sync(image)
 
     # Sync immediately to the target slot once changed
-    bridge_driver().sync_texture(image)
+    driver = bridge_driver()
+    if driver.is_connected():
+        driver.sync_texture(image)
 
 
 @autoregister
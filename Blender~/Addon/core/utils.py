@@ -1,20 +1,23 @@
 
+import os
 from ctypes import create_string_buffer
+from functools import lru_cache
 
-__string_buffer_cache = dict()
+# Set COHERENCE_DEBUG in the environment to print debug() output to the console
+IS_DEBUG = bool(os.environ.get('COHERENCE_DEBUG'))
 
+# Object types that can be evaluated to a mesh representation after modifiers.
+# META is excluded here - as they are dealt with separately.
+SUPPORTED_OBJECT_TYPES = frozenset(('MESH', 'CURVE', 'SURFACE', 'FONT'))
+
+@lru_cache(maxsize=4096)
 def get_string_buffer(value: str):
-    """Use a cache to reuse C string buffers wherever possible"""
-    global __string_buffer_cache
+    """Use a cache to reuse C string buffers wherever possible
 
-    # TODO: Is this any faster than just create_string_buffer?
-    # timeit plz.
-    try:
-        return __string_buffer_cache[value]
-    except KeyError:
-        buf = create_string_buffer(value.encode())
-        __string_buffer_cache[value] = buf
-        return buf
+    The cache is bounded so that buffers for names that no longer
+    exist (e.g. after renames) are eventually released.
+    """
+    return create_string_buffer(value.encode())
 
 def generate_unique_id():
     """Create a unique Uint32 bridge ID for the object"""
@@ -35,10 +38,7 @@ def is_supported_object(obj):
 
     # TODO: Meta wouldn't work here - we need *one* meta object representation
     # not per-meta.
-
-    # Anything that can be evaluated to a mesh representation after modifiers.
-    # META is excluded here - as they are dealt with separately.
-    return obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT' }
+    return obj.type in SUPPORTED_OBJECT_TYPES
 
 def is_renamed(obj):
     """Test if the given object has been renamed at some point.
@@ -156,9 +156,15 @@ def get_mesh_uid(obj) -> str:
 def log(msg):
     print(msg, flush = True)
 
-def debug(msg):
-    print(msg, flush = True)
-    pass
+if IS_DEBUG:
+    def debug(msg, *args):
+        """Print to console while in debug mode.
+
+        Any args are formatted into msg only when the message is printed.
+        """
+        print(msg.format(*args) if args else msg, flush = True)
+else:
+    def debug(msg, *args): pass
 
 def error(msg):
     print('ERROR: ' + msg, flush = True)
@@ -215,14 +215,15 @@ namespace Coherence
         /// Read from the viewport image buffer and copy
         /// pixel data into the appropriate viewport.
         /// </summary>
-        internal void ConsumePixels()
+        /// <returns>True if a new frame was read from the buffer</returns>
+        internal bool ConsumePixels()
         {
             if (pixelsConsumer == null || pixelsConsumer.ShuttingDown)
             {
-                return;
+                return false;
             }
 
-            pixelsConsumer.Read((ptr) =>
+            var bytesRead = pixelsConsumer.Read((ptr) =>
             {
                 var headerSize = FastStructure.SizeOf<InteropRenderHeader>();
                 var header = FastStructure.PtrToStructure<InteropRenderHeader>(ptr);
@@ -238,6 +239,8 @@ namespace Coherence
 
                 return headerSize + pixelDataSize;
             }, READ_WAIT);
+
+            return bytesRead > 0;
         }
 
         /// <summary>
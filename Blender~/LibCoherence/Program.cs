@@ -270,13 +270,13 @@ namespace Coherence
         /// <summary>
         /// Experimental control over bridge's pixel buffer consumer.
         /// </summary>
+        /// <returns>1 if a new render texture frame was consumed, 0 if none were available</returns>
         [DllExport]
         public static int ConsumeRenderTextures()
         {
             try
             {
-                Bridge.ConsumePixels();
-                return 1;
+                return Bridge.ConsumePixels() ? 1 : 0;
             }
             catch (Exception e)
             {